@@ -0,0 +1,10 @@
+"""Gunicorn configuration for running the API under multiple uvicorn workers."""
+
+import os
+
+# 2n+1 workers saturates all cores for I/O-bound handlers
+workers = int(os.getenv("WEB_CONCURRENCY", (os.cpu_count() or 1) * 2 + 1))
+worker_class = "uvicorn.workers.UvicornWorker"
+bind = "0.0.0.0:" + os.getenv("PORT", "8000")
+keepalive = 5
+graceful_timeout = 30
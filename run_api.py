@@ -10,19 +10,32 @@ src_path = Path(__file__).parent / "src"
 sys.path.insert(0, str(src_path))
 
 import uvicorn
-from research_integrator.api.app import app
 
 if __name__ == "__main__":
     # Get port from environment or use default
     port = int(os.getenv("PORT", "8000"))
 
+    if os.getenv("PROD"):
+        # One gunicorn master fanning out to uvicorn workers across all cores
+        os.execvp(
+            "gunicorn",
+            ["gunicorn", "-c", "gunicorn_conf.py", "research_integrator.api.app:app"],
+        )
+
+    # Auto-reload (and its filesystem-polling supervisor) only in development
+    reload = bool(os.getenv("DEV"))
+
     print(f"Starting Research Integrator API server on port {port}")
     print(f"API documentation will be available at: http://localhost:{port}/api/docs")
 
     uvicorn.run(
-        app,
+        "research_integrator.api.app:app",  # import string required for workers > 1
         host="0.0.0.0",
         port=port,
-        reload=True,
-        log_level="info",
+        reload=reload,
+        loop="uvloop",
+        http="httptools",
+        log_level=os.getenv("LOG_LEVEL", "warning"),
+        access_log=False,
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
     )
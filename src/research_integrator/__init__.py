@@ -1,7 +1,15 @@
 """Research Integrator - Academic database integration with AI summarization."""
 
-from .config import Config
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+# Load the project .env once at import time, pinned to the repository
+# root, so Config construction never walks parent directories for it.
+load_dotenv(Path(__file__).resolve().parents[2] / ".env", override=False)
+
+from .config import Config, get_config
 from .logger import setup_logger
 
 __version__ = "0.1.0"
-__all__ = ["Config", "setup_logger"]
+__all__ = ["Config", "get_config", "setup_logger"]
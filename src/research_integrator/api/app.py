@@ -1,15 +1,28 @@
 """FastAPI application for Research Integrator API."""
 
+import asyncio
+import functools
+import hashlib
+import logging
 import os
+import re
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from datetime import datetime
 from typing import List, Optional
 
-from fastapi import FastAPI, HTTPException, Security, status
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+import httpx
+import orjson
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Request, Response, status
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
-from ..config import Config
+from ..cache import get_response_cache
+from ..config import get_config
+from ..index import get_index
 from ..logger import get_logger
+from ..sources import bucket_paper_ids, fetch_arxiv_batch, fetch_pubmed_batch
 from .models import (
     ContextRequest,
     ContextResponse,
@@ -25,76 +38,169 @@ from .models import (
 )
 
 # Initialize configuration and logger
-config = Config()
+config = get_config()
 logger = get_logger("research_integrator.api")
 
-# Security scheme - auto_error=False to handle missing auth manually
-security = HTTPBearer(auto_error=False)
+# API key for the current request, set by the auth middleware
+_api_key: ContextVar[str] = ContextVar("api_key", default="")
 
-# Create FastAPI app
-app = FastAPI(
-    title="Research Integrator API",
-    description="""
-    API for integrating research data from multiple sources including PubMed, arXiv, and LLM services.
+# Paths served without authentication
+_PUBLIC_PATHS = frozenset({"/health", "/api/docs", "/api/redoc", "/api/openapi.json"})
 
-    This API provides endpoints for searching, fetching, summarizing research papers,
-    managing user preferences, and handling context data.
-    """,
-    version="1.0.0",
-    contact={
-        "name": "Research Integrator Team",
-        "email": "support@research-integrator.com",
-    },
-    license_info={
-        "name": "MIT",
-        "url": "https://opensource.org/licenses/MIT",
-    },
-    docs_url="/api/docs",
-    redoc_url="/api/redoc",
-    openapi_url="/api/openapi.json",
-)
+# Accepted Bearer token format, matched against the raw header bytes.
+# Any non-empty token passes for now (see verify_api_key).
+_BEARER_RE = re.compile(rb"^Bearer ([A-Za-z0-9._\-]{1,256})$")
 
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
 
+def _new_http_client() -> httpx.AsyncClient:
+    """Build the app-wide AsyncClient with keep-alive connection pooling."""
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=10.0,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+    )
 
-def verify_api_key(credentials: Optional[HTTPAuthorizationCredentials] = Security(security)) -> str:
-    """Verify API key from Authorization header.
 
-    Args:
-        credentials: HTTP authorization credentials
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create shared resources at startup and dispose of them at shutdown."""
+    app.state.http = _new_http_client()
+    try:
+        yield
+    finally:
+        await app.state.http.aclose()
+
+
+# Routes are declared on a router so create_app can assemble
+# differently-configured application instances around them
+router = APIRouter()
 
-    Returns:
-        The verified API key
 
-    Raises:
-        HTTPException: If API key is invalid
+async def verify_api_key(request: Request, call_next):
+    """Verify the API key from the Authorization header once per request.
+
+    Parses the "Bearer TOKEN" header without the dependency-injection
+    machinery and stashes the token in a ContextVar for handlers that
+    need it (see get_api_key).
     """
-    if not credentials:
-        raise HTTPException(
+    if request.url.path in _PUBLIC_PATHS or request.method == "OPTIONS":
+        return await call_next(request)
+
+    # Scan the raw header bytes to avoid building the decoded Headers view
+    authorization = None
+    for name, value in request.scope["headers"]:
+        if name == b"authorization":
+            authorization = value
+            break
+
+    if authorization is None or not authorization.startswith(b"Bearer") or authorization == b"Bearer":
+        return Response(
+            content=_ERR_MISSING_API_KEY,
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=create_error_response("MISSING_API_KEY", "API key is required"),
+            media_type="application/json",
         )
 
-    # Extract token from "Bearer TOKEN" format
-    token = credentials.credentials
-
-    # For now, we'll accept any non-empty token
+    # For now, we'll accept any well-formed non-empty token
     # In production, this should validate against a proper API key store
-    if not token or token.strip() == "":
-        raise HTTPException(
+    match = _BEARER_RE.match(authorization)
+    if match is None:
+        return Response(
+            content=_ERR_INVALID_API_KEY,
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=create_error_response("INVALID_API_KEY", "Invalid API key"),
+            media_type="application/json",
         )
 
-    logger.info("API key verified", extra={"extra_fields": {"token_prefix": token[:8] + "..."}})
-    return token
+    token = match.group(1).decode("latin-1")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("API key verified", extra={"extra_fields": {"token_prefix": token[:8] + "..."}})
+    _api_key.set(token)
+    return await call_next(request)
+
+
+def get_http(request: Request) -> httpx.AsyncClient:
+    """Get the shared AsyncClient for outbound backend calls.
+
+    Normally created by the lifespan handler; built lazily if the app is
+    used without running lifespan (e.g. a bare TestClient).
+
+    Returns:
+        The app-wide AsyncClient.
+    """
+    http = getattr(request.app.state, "http", None)
+    if http is None or http.is_closed:
+        http = _new_http_client()
+        request.app.state.http = http
+    return http
+
+
+def get_api_key() -> str:
+    """Get the API key validated by the auth middleware for this request.
+
+    Returns:
+        The verified API key, or an empty string outside a request.
+    """
+    return _api_key.get()
+
+
+@functools.lru_cache(maxsize=1)
+def _now_for_second(second: int) -> datetime:
+    """Construct the timestamp for a given whole second."""
+    return datetime.now()
+
+
+def coarse_now() -> datetime:
+    """Get the current time cached at one-second granularity.
+
+    Good enough for response/logging timestamps while skipping a clock
+    read and datetime allocation on every call.
+
+    Returns:
+        Cached datetime for the current second.
+    """
+    return _now_for_second(int(time.time()))
+
+
+def _serialize_with_etag(model) -> tuple:
+    """Serialize a response model and compute its ETag.
+
+    Returns:
+        Tuple of (body bytes, etag string).
+    """
+    body = orjson.dumps(model.model_dump(mode="json"))
+    return body, hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def _etag_response(
+    body: bytes,
+    etag: str,
+    http_request: Request,
+    media_type: str = "application/json",
+) -> Response:
+    """Build a response for a pre-serialized body, honoring If-None-Match.
+
+    Returns:
+        A 304 response when the client's ETag still matches, otherwise
+        the body with ETag and Cache-Control headers set.
+    """
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=60"}
+    if http_request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type=media_type, headers=headers)
+
+
+def etagged(model, http_request: Request) -> Response:
+    """Serialize a response model with an ETag, honoring If-None-Match.
+
+    Args:
+        model: Response model instance to serialize.
+        http_request: Incoming request, checked for an If-None-Match header.
+
+    Returns:
+        A 304 response when the client's ETag still matches, otherwise
+        the serialized body with ETag and Cache-Control headers set.
+    """
+    body, etag = _serialize_with_etag(model)
+    return _etag_response(body, etag, http_request)
 
 
 def create_error_response(code: str, message: str, details: dict = None) -> dict:
@@ -118,16 +224,19 @@ def create_error_response(code: str, message: str, details: dict = None) -> dict
     return error_response
 
 
-@app.exception_handler(HTTPException)
+# Pre-serialized payloads for the common auth failures, so the 401 path
+# skips dict construction and JSON encoding entirely.
+_ERR_MISSING_API_KEY = orjson.dumps(create_error_response("MISSING_API_KEY", "API key is required"))
+_ERR_INVALID_API_KEY = orjson.dumps(create_error_response("INVALID_API_KEY", "Invalid API key"))
+
+
 async def http_exception_handler(request, exc):
     """Handle HTTP exceptions with standardized error format."""
-    from fastapi.responses import JSONResponse
-
     logger.error(f"HTTP exception: {exc.detail}", extra={"extra_fields": {"status_code": exc.status_code}})
 
     # If detail is already in our error format, return it
     if isinstance(exc.detail, dict) and "code" in exc.detail:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.status_code,
             content=exc.detail
         )
@@ -139,17 +248,14 @@ async def http_exception_handler(request, exc):
         details={"status_code": exc.status_code}
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content=error_content
     )
 
 
-@app.exception_handler(Exception)
 async def general_exception_handler(request, exc):
     """Handle general exceptions with standardized error format."""
-    from fastapi.responses import JSONResponse
-
     logger.error(f"Unexpected error: {str(exc)}", exc_info=True)
 
     error_content = create_error_response(
@@ -158,15 +264,15 @@ async def general_exception_handler(request, exc):
         details={"error_type": type(exc).__name__}
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content=error_content
     )
 
 
-@app.post(
+@router.post(
     "/search",
-    response_model=SearchResponse,
+    response_model=None,
     responses={
         400: {"model": ErrorResponse, "description": "Bad request"},
         401: {"model": ErrorResponse, "description": "Unauthorized"},
@@ -176,27 +282,46 @@ async def general_exception_handler(request, exc):
     summary="Search for research papers",
     description="Search for research papers across multiple sources (PubMed, arXiv, etc.)",
 )
-async def search_papers(
-    request: SearchRequest,
-    api_key: str = Security(verify_api_key)
-) -> SearchResponse:
+async def search_papers(request: SearchRequest, http_request: Request) -> Response:
     """Search for research papers."""
-    logger.info("Search request received", extra={"extra_fields": {"query": request.query}})
-
-    # TODO: Implement actual search logic
-    # For now, return a mock response
-    return SearchResponse(
-        papers=[],
-        total=0,
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Search request received", extra={"extra_fields": {"query": request.query}})
+
+    cache = get_response_cache()
+    cache_key = None
+    if cache.enabled:
+        cache_key = "search:" + hashlib.blake2b(
+            orjson.dumps(request.model_dump(mode="json")), digest_size=16
+        ).hexdigest()
+        entry = await cache.get(cache_key)
+        if entry is not None:
+            # HIT: reuse the stored ETag instead of re-hashing the body
+            return _etag_response(entry["body"], entry["etag"], http_request, entry["ct"])
+
+    index = get_index()
+    if index is not None:
+        papers, total = index.search(request.query, limit=request.limit, offset=request.offset)
+    else:
+        # TODO: Query live sources when no local index is loaded
+        # For now, return a mock response
+        papers, total = [], 0
+
+    response = SearchResponse(
+        papers=papers,
+        total=total,
         query=request.query,
         offset=request.offset,
         limit=request.limit,
     )
+    body, etag = _serialize_with_etag(response)
+    if cache_key is not None:
+        await cache.set(cache_key, body, etag, "application/json")
+    return _etag_response(body, etag, http_request)
 
 
-@app.post(
+@router.post(
     "/fetch",
-    response_model=FetchResponse,
+    response_model=None,
     responses={
         400: {"model": ErrorResponse, "description": "Bad request"},
         401: {"model": ErrorResponse, "description": "Unauthorized"},
@@ -209,19 +334,41 @@ async def search_papers(
 )
 async def fetch_paper(
     request: FetchRequest,
-    api_key: str = Security(verify_api_key)
-) -> FetchResponse:
+    http_request: Request,
+    client: httpx.AsyncClient = Depends(get_http),
+) -> Response:
     """Fetch paper details."""
-    logger.info("Fetch request received", extra={"extra_fields": {"paper_ids": request.paper_ids}})
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Fetch request received", extra={"extra_fields": {"paper_ids": request.paper_ids}})
+
+    cache = get_response_cache()
+    cache_key = None
+    if cache.enabled:
+        cache_key = "fetch:" + hashlib.blake2b(
+            orjson.dumps(request.model_dump(mode="json")), digest_size=16
+        ).hexdigest()
+        entry = await cache.get(cache_key)
+        if entry is not None:
+            # HIT: reuse the stored ETag instead of re-hashing the body
+            return _etag_response(entry["body"], entry["etag"], http_request, entry["ct"])
+
+    # Group ids by backend and fetch the buckets concurrently, one
+    # batched request per backend.
+    pubmed_ids, arxiv_ids, _ = bucket_paper_ids(request.paper_ids)
+    pubmed_papers, arxiv_papers = await asyncio.gather(
+        fetch_pubmed_batch(client, pubmed_ids),
+        fetch_arxiv_batch(client, arxiv_ids),
+    )
 
-    # TODO: Implement actual fetch logic
-    # For now, return a mock response
-    return FetchResponse(papers=[])
+    body, etag = _serialize_with_etag(FetchResponse(papers=[*pubmed_papers, *arxiv_papers]))
+    if cache_key is not None:
+        await cache.set(cache_key, body, etag, "application/json")
+    return _etag_response(body, etag, http_request)
 
 
-@app.post(
+@router.post(
     "/summarize",
-    response_model=SummarizeResponse,
+    response_model=None,
     responses={
         400: {"model": ErrorResponse, "description": "Bad request"},
         401: {"model": ErrorResponse, "description": "Unauthorized"},
@@ -231,12 +378,10 @@ async def fetch_paper(
     summary="Summarize research papers",
     description="Generate AI-powered summaries of research papers",
 )
-async def summarize_paper(
-    request: SummarizeRequest,
-    api_key: str = Security(verify_api_key)
-) -> SummarizeResponse:
+async def summarize_paper(request: SummarizeRequest) -> SummarizeResponse:
     """Summarize research papers."""
-    logger.info("Summarize request received", extra={"extra_fields": {"paper_id": request.paper_id}})
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Summarize request received", extra={"extra_fields": {"paper_id": request.paper_id}})
 
     # TODO: Implement actual summarization logic
     # For now, return a mock response
@@ -245,13 +390,13 @@ async def summarize_paper(
         summary="This is a mock summary.",
         summary_type=request.summary_type,
         word_count=5,
-        generated_at=datetime.now(),
+        generated_at=coarse_now(),
     )
 
 
-@app.get(
+@router.get(
     "/prefs",
-    response_model=PreferencesResponse,
+    response_model=None,
     responses={
         401: {"model": ErrorResponse, "description": "Unauthorized"},
         500: {"model": ErrorResponse, "description": "Internal server error"},
@@ -260,24 +405,24 @@ async def summarize_paper(
     summary="Get user preferences",
     description="Retrieve user preferences and settings",
 )
-async def get_preferences(
-    api_key: str = Security(verify_api_key)
-) -> PreferencesResponse:
+async def get_preferences(http_request: Request) -> Response:
     """Get user preferences."""
-    logger.info("Get preferences request received")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Get preferences request received")
 
     # TODO: Implement actual preferences retrieval logic
     # For now, return a mock response
-    return PreferencesResponse(
+    response = PreferencesResponse(
         user_id="mock_user",
         preferences=PreferencesRequest(),
-        updated_at=datetime.now(),
+        updated_at=coarse_now(),
     )
+    return etagged(response, http_request)
 
 
-@app.put(
+@router.put(
     "/prefs",
-    response_model=PreferencesResponse,
+    response_model=None,
     responses={
         400: {"model": ErrorResponse, "description": "Bad request"},
         401: {"model": ErrorResponse, "description": "Unauthorized"},
@@ -287,25 +432,23 @@ async def get_preferences(
     summary="Update user preferences",
     description="Update user preferences and settings",
 )
-async def update_preferences(
-    request: PreferencesRequest,
-    api_key: str = Security(verify_api_key)
-) -> PreferencesResponse:
+async def update_preferences(request: PreferencesRequest) -> PreferencesResponse:
     """Update user preferences."""
-    logger.info("Update preferences request received")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Update preferences request received")
 
     # TODO: Implement actual preferences update logic
     # For now, return a mock response
     return PreferencesResponse(
         user_id="mock_user",
         preferences=request,
-        updated_at=datetime.now(),
+        updated_at=coarse_now(),
     )
 
 
-@app.post(
+@router.post(
     "/context",
-    response_model=ContextResponse,
+    response_model=None,
     responses={
         400: {"model": ErrorResponse, "description": "Bad request"},
         401: {"model": ErrorResponse, "description": "Unauthorized"},
@@ -315,12 +458,10 @@ async def update_preferences(
     summary="Manage context data",
     description="Store and retrieve context data for research sessions",
 )
-async def manage_context(
-    request: ContextRequest,
-    api_key: str = Security(verify_api_key)
-) -> ContextResponse:
+async def manage_context(request: ContextRequest) -> ContextResponse:
     """Manage context data."""
-    logger.info("Manage context request received", extra={"extra_fields": {"action": request.action}})
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Manage context request received", extra={"extra_fields": {"action": request.action}})
 
     # TODO: Implement actual context management logic
     # For now, return a mock response
@@ -328,13 +469,13 @@ async def manage_context(
         session_id=request.session_id or "mock_session",
         action=request.action,
         context_data=request.context_data,
-        timestamp=datetime.now(),
+        timestamp=coarse_now(),
     )
 
 
-@app.get(
+@router.get(
     "/context",
-    response_model=ContextResponse,
+    response_model=None,
     responses={
         401: {"model": ErrorResponse, "description": "Unauthorized"},
         404: {"model": ErrorResponse, "description": "Context not found"},
@@ -344,27 +485,82 @@ async def manage_context(
     summary="Get context data",
     description="Retrieve stored context data for research sessions",
 )
-async def get_context(
-    session_id: Optional[str] = None,
-    api_key: str = Security(verify_api_key)
-) -> ContextResponse:
+async def get_context(http_request: Request, session_id: Optional[str] = None) -> Response:
     """Get context data."""
-    logger.info("Get context request received", extra={"extra_fields": {"session_id": session_id}})
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Get context request received", extra={"extra_fields": {"session_id": session_id}})
 
     # TODO: Implement actual context retrieval logic
     # For now, return a mock response
-    return ContextResponse(
+    response = ContextResponse(
         session_id=session_id or "mock_session",
         action="retrieve",
         context_data={},
-        timestamp=datetime.now(),
+        timestamp=coarse_now(),
     )
+    return etagged(response, http_request)
 
 
-@app.get("/health")
+@router.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {"status": "healthy", "timestamp": datetime.now()}
+    return {"status": "healthy", "timestamp": coarse_now()}
+
+
+def create_app(docs: bool = True) -> FastAPI:
+    """Build a configured application instance.
+
+    Args:
+        docs: Whether to mount the Swagger UI, ReDoc and OpenAPI schema
+            routes. Disabling them skips the OpenAPI schema build for
+            consumers that never request it (e.g. most tests).
+
+    Returns:
+        FastAPI application with middleware, exception handlers and all
+        API routes registered.
+    """
+    application = FastAPI(
+        title="Research Integrator API",
+        description="""
+    API for integrating research data from multiple sources including PubMed, arXiv, and LLM services.
+
+    This API provides endpoints for searching, fetching, summarizing research papers,
+    managing user preferences, and handling context data.
+    """,
+        version="1.0.0",
+        contact={
+            "name": "Research Integrator Team",
+            "email": "support@research-integrator.com",
+        },
+        license_info={
+            "name": "MIT",
+            "url": "https://opensource.org/licenses/MIT",
+        },
+        docs_url="/api/docs" if docs else None,
+        redoc_url="/api/redoc" if docs else None,
+        openapi_url="/api/openapi.json" if docs else None,
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
+    )
+
+    # Register auth before CORS: later-added middleware wraps outermost,
+    # so this keeps CORS headers on middleware-issued 401s (preflight
+    # OPTIONS requests are skipped by verify_api_key itself)
+    application.middleware("http")(verify_api_key)
+    application.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],  # Configure appropriately for production
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    application.add_exception_handler(HTTPException, http_exception_handler)
+    application.add_exception_handler(Exception, general_exception_handler)
+    application.include_router(router)
+    return application
+
+
+app = create_app()
 
 
 if __name__ == "__main__":
@@ -377,6 +573,9 @@ if __name__ == "__main__":
         "research_integrator.api.app:app",
         host="0.0.0.0",
         port=port,
-        reload=True,
-        log_level="info",
+        reload=bool(os.getenv("DEV")),
+        loop="uvloop",
+        http="httptools",
+        log_level=os.getenv("LOG_LEVEL", "warning"),
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
     )
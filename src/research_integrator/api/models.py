@@ -4,7 +4,7 @@ from datetime import date, datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class SourceEnum(str, Enum):
@@ -32,6 +32,8 @@ class ContextActionEnum(str, Enum):
 # Error Response Models
 class ErrorResponse(BaseModel):
     """Standard error response model."""
+    model_config = ConfigDict(extra="ignore")
+
     code: str = Field(..., description="Error code string")
     message: str = Field(..., description="User-friendly error message")
     details: Optional[Dict[str, Any]] = Field(None, description="Optional structured details about the error")
@@ -40,6 +42,8 @@ class ErrorResponse(BaseModel):
 # Paper Model
 class Paper(BaseModel):
     """Paper model representing a research paper."""
+    model_config = ConfigDict(extra="ignore")
+
     id: str = Field(..., description="Unique identifier for the paper")
     title: str = Field(..., description="Title of the paper")
     authors: Optional[List[str]] = Field(None, description="List of authors")
@@ -55,6 +59,8 @@ class Paper(BaseModel):
 # Search Models
 class SearchFilters(BaseModel):
     """Search filters model."""
+    model_config = ConfigDict(extra="ignore")
+
     date_from: Optional[date] = Field(None, description="Filter papers from this date")
     date_to: Optional[date] = Field(None, description="Filter papers to this date")
     journal: Optional[str] = Field(None, description="Filter by journal name")
@@ -62,6 +68,8 @@ class SearchFilters(BaseModel):
 
 class SearchRequest(BaseModel):
     """Search request model."""
+    model_config = ConfigDict(extra="ignore")
+
     query: str = Field(..., description="Search query")
     sources: List[str] = Field(default=["all"], description="Sources to search in")
     limit: int = Field(default=20, ge=1, le=100, description="Maximum number of results to return")
@@ -71,6 +79,9 @@ class SearchRequest(BaseModel):
 
 class SearchResponse(BaseModel):
     """Search response model."""
+    # use_enum_values stores plain strings, skipping enum re-wrapping on output
+    model_config = ConfigDict(extra="ignore", use_enum_values=True)
+
     papers: List[Paper] = Field(..., description="List of papers matching the search")
     total: int = Field(..., description="Total number of papers found")
     query: str = Field(..., description="Original search query")
@@ -81,18 +92,25 @@ class SearchResponse(BaseModel):
 # Fetch Models
 class FetchRequest(BaseModel):
     """Fetch request model."""
+    model_config = ConfigDict(extra="ignore")
+
     paper_ids: List[str] = Field(..., description="List of paper IDs to fetch")
     include_full_text: bool = Field(default=False, description="Whether to include full text if available")
 
 
 class FetchResponse(BaseModel):
     """Fetch response model."""
+    # use_enum_values stores plain strings, skipping enum re-wrapping on output
+    model_config = ConfigDict(extra="ignore", use_enum_values=True)
+
     papers: List[Paper] = Field(..., description="List of fetched papers with detailed information")
 
 
 # Summarize Models
 class SummarizeRequest(BaseModel):
     """Summarize request model."""
+    model_config = ConfigDict(extra="ignore")
+
     paper_id: str = Field(..., description="ID of the paper to summarize")
     summary_type: SummaryTypeEnum = Field(default=SummaryTypeEnum.BRIEF, description="Type of summary to generate")
     max_length: int = Field(default=200, ge=50, le=1000, description="Maximum length of summary in words")
@@ -100,6 +118,8 @@ class SummarizeRequest(BaseModel):
 
 class SummarizeResponse(BaseModel):
     """Summarize response model."""
+    model_config = ConfigDict(extra="ignore")
+
     paper_id: str = Field(..., description="ID of the summarized paper")
     summary: str = Field(..., description="Generated summary")
     summary_type: SummaryTypeEnum = Field(..., description="Type of summary generated")
@@ -110,18 +130,24 @@ class SummarizeResponse(BaseModel):
 # Preferences Models
 class SummaryPreferences(BaseModel):
     """Summary preferences model."""
+    model_config = ConfigDict(extra="ignore")
+
     default_type: SummaryTypeEnum = Field(default=SummaryTypeEnum.BRIEF, description="Default summary type")
     max_length: int = Field(default=200, ge=50, le=1000, description="Default maximum summary length")
 
 
 class NotificationSettings(BaseModel):
     """Notification settings model."""
+    model_config = ConfigDict(extra="ignore")
+
     email_notifications: bool = Field(default=True, description="Enable email notifications")
     search_alerts: bool = Field(default=False, description="Enable search alerts")
 
 
 class PreferencesRequest(BaseModel):
     """Preferences request model."""
+    model_config = ConfigDict(extra="ignore")
+
     default_sources: Optional[List[str]] = Field(None, description="Default sources for searches")
     default_limit: Optional[int] = Field(None, ge=1, le=100, description="Default number of results per search")
     summary_preferences: Optional[SummaryPreferences] = Field(None, description="Summary preferences")
@@ -130,6 +156,8 @@ class PreferencesRequest(BaseModel):
 
 class PreferencesResponse(BaseModel):
     """Preferences response model."""
+    model_config = ConfigDict(extra="ignore")
+
     user_id: str = Field(..., description="User identifier")
     preferences: PreferencesRequest = Field(..., description="User preferences")
     updated_at: datetime = Field(..., description="Timestamp when preferences were last updated")
@@ -138,6 +166,8 @@ class PreferencesResponse(BaseModel):
 # Context Models
 class ContextRequest(BaseModel):
     """Context request model."""
+    model_config = ConfigDict(extra="ignore")
+
     action: ContextActionEnum = Field(..., description="Action to perform on context data")
     session_id: Optional[str] = Field(None, description="Session identifier")
     context_data: Optional[Dict[str, Any]] = Field(None, description="Context data to store or update")
@@ -145,6 +175,9 @@ class ContextRequest(BaseModel):
 
 class ContextResponse(BaseModel):
     """Context response model."""
+    # use_enum_values stores plain strings, skipping enum re-wrapping on output
+    model_config = ConfigDict(extra="ignore", use_enum_values=True)
+
     session_id: str = Field(..., description="Session identifier")
     action: ContextActionEnum = Field(..., description="Action that was performed")
     context_data: Optional[Dict[str, Any]] = Field(None, description="Current context data")
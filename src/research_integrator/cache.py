@@ -0,0 +1,105 @@
+"""Redis-backed cache for pre-serialized API responses.
+
+Each entry stores the response body, media type and the ETag computed
+when the entry was written, so a cache hit copies the stored ETag into
+the response header instead of re-serializing or re-hashing the body.
+The cache is disabled (every lookup is a miss) when REDIS_URL is unset.
+"""
+
+from typing import Dict, Optional, Union
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+
+from .config import get_config
+from .logger import get_logger
+
+logger = get_logger("research_integrator.cache")
+
+# Default time-to-live for cached responses, matching Cache-Control max-age
+DEFAULT_TTL = 60
+
+
+class ResponseCache:
+    """Cache of serialized responses keyed by request parameters."""
+
+    def __init__(self, redis_url: Optional[str], ttl: int = DEFAULT_TTL):
+        """Initialize the cache.
+
+        Args:
+            redis_url: Redis connection URL; None disables the cache.
+            ttl: Seconds before a cached response expires.
+        """
+        self._redis = aioredis.from_url(redis_url) if redis_url else None
+        self.ttl = ttl
+
+    @property
+    def enabled(self) -> bool:
+        """Whether a Redis backend is configured."""
+        return self._redis is not None
+
+    async def get(self, key: str) -> Optional[Dict[str, Union[bytes, str]]]:
+        """Look up a cached response.
+
+        Args:
+            key: Cache key for the request.
+
+        Returns:
+            Mapping with "body" (bytes), "etag" (str) and "ct" (str)
+            fields, or None on a miss or when the cache is disabled.
+        """
+        if self._redis is None:
+            return None
+
+        try:
+            entry = await self._redis.hgetall(key)
+        except (RedisError, OSError) as exc:
+            # Fail open: an unreachable cache must not take down the
+            # endpoints it accelerates
+            logger.warning(f"Cache lookup failed, treating as miss: {exc}")
+            return None
+        if not entry:
+            return None
+
+        return {
+            "body": entry[b"body"],
+            "etag": entry[b"etag"].decode(),
+            "ct": entry[b"ct"].decode(),
+        }
+
+    async def set(self, key: str, body: bytes, etag: str, media_type: str) -> None:
+        """Store a serialized response together with its ETag.
+
+        Args:
+            key: Cache key for the request.
+            body: Pre-serialized response body.
+            etag: ETag computed for the body.
+            media_type: Response content type.
+        """
+        if self._redis is None:
+            return
+
+        try:
+            # One transactional round trip: the entry and its TTL land
+            # together, so a transient failure can never leave a key
+            # that serves its stale body forever
+            pipe = self._redis.pipeline()
+            pipe.hset(key, mapping={"body": body, "etag": etag, "ct": media_type})
+            pipe.expire(key, self.ttl)
+            await pipe.execute()
+        except (RedisError, OSError) as exc:
+            # Fail open: the response is already serialized, so skipping
+            # the store only costs the next request a cache miss
+            logger.warning(f"Cache store failed, skipping: {exc}")
+
+
+# Cache shared by the API handlers; built lazily from config.
+_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Get the shared ResponseCache, creating it from config on first use."""
+    global _cache
+    if _cache is None:
+        _cache = ResponseCache(get_config().redis_url)
+    return _cache
@@ -1,69 +1,76 @@
 """Configuration management using python-dotenv."""
 
+import functools
 import os
-from pathlib import Path
-from typing import Optional
+from dataclasses import InitVar, dataclass, field
+from typing import FrozenSet, Optional, Tuple
 
 from dotenv import load_dotenv
 
+# Environment variables Config reads, in a fixed order for cache keys.
+_ENV_VARS = (
+    "PUBMED_API_KEY",
+    "ARXIV_USER_AGENT",
+    "LLM_API_KEY",
+    "LLM_ENDPOINT",
+    "REDIS_URL",
+    "LOG_LEVEL",
+    "LOG_FILE",
+)
 
+
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Configuration class that loads environment variables using python-dotenv."""
+    """Configuration snapshot loaded from environment variables using python-dotenv.
+
+    Values are read from the environment once at construction, so attribute
+    access is a plain slot read with no repeated os.getenv lookups.
+    """
+
+    env_file: InitVar[Optional[str]] = None
 
-    def __init__(self, env_file: Optional[str] = None):
-        """Initialize configuration by loading environment variables.
+    pubmed_api_key: Optional[str] = field(init=False)
+    arxiv_user_agent: str = field(init=False)
+    llm_api_key: Optional[str] = field(init=False)
+    llm_endpoint: Optional[str] = field(init=False)
+    redis_url: Optional[str] = field(init=False)
+    log_level: str = field(init=False)
+    log_file: str = field(init=False)
+
+    def __post_init__(self, env_file: Optional[str]) -> None:
+        """Load environment variables and snapshot them onto the instance.
 
         Args:
-            env_file: Path to .env file. If None, searches for .env in current and parent directories.
+            env_file: Path to .env file. If None, relies on the project
+                .env loaded once at package import.
         """
         if env_file:
             load_dotenv(env_file)
-        else:
-            # Search for .env file in current directory and parent directories
-            current_dir = Path.cwd()
-            for path in [current_dir] + list(current_dir.parents):
-                env_path = path / ".env"
-                if env_path.exists():
-                    load_dotenv(env_path)
-                    break
-            else:
-                # If no .env file found, still load from environment
-                load_dotenv()
-
-    @property
-    def pubmed_api_key(self) -> Optional[str]:
-        """Get PubMed API key from environment."""
-        return os.getenv("PUBMED_API_KEY")
-
-    @property
-    def arxiv_user_agent(self) -> str:
-        """Get arXiv user agent from environment."""
-        return os.getenv("ARXIV_USER_AGENT", "research-integrator/1.0")
-
-    @property
-    def llm_api_key(self) -> Optional[str]:
-        """Get LLM API key from environment."""
-        return os.getenv("LLM_API_KEY")
-
-    @property
-    def llm_endpoint(self) -> Optional[str]:
-        """Get LLM endpoint URL from environment."""
-        return os.getenv("LLM_ENDPOINT")
-
-    @property
-    def redis_url(self) -> Optional[str]:
-        """Get Redis URL from environment."""
-        return os.getenv("REDIS_URL")
-
-    @property
-    def log_level(self) -> str:
-        """Get logging level from environment."""
-        return os.getenv("LOG_LEVEL", "INFO").upper()
-
-    @property
-    def log_file(self) -> str:
-        """Get log file path from environment."""
-        return os.getenv("LOG_FILE", "logs/research_integrator.log")
+
+        set_attr = object.__setattr__  # frozen dataclass: assign via object
+        set_attr(self, "pubmed_api_key", os.getenv("PUBMED_API_KEY"))
+        set_attr(self, "arxiv_user_agent", os.getenv("ARXIV_USER_AGENT", "research-integrator/1.0"))
+        set_attr(self, "llm_api_key", os.getenv("LLM_API_KEY"))
+        set_attr(self, "llm_endpoint", os.getenv("LLM_ENDPOINT"))
+        set_attr(self, "redis_url", os.getenv("REDIS_URL"))
+        set_attr(self, "log_level", os.getenv("LOG_LEVEL", "WARNING").upper())
+        set_attr(self, "log_file", os.getenv("LOG_FILE", "logs/research_integrator.log"))
+
+    @classmethod
+    @functools.lru_cache(maxsize=8)
+    def load(cls, env_snapshot: FrozenSet[Tuple[str, str]]) -> "Config":
+        """Get a memoized Config for a given environment snapshot.
+
+        Args:
+            env_snapshot: Hashable view of the environment, typically
+                frozenset(os.environ.items()). Distinct snapshots yield
+                distinct instances, so the cache invalidates naturally
+                when the environment changes.
+
+        Returns:
+            Cached Config instance for the snapshot.
+        """
+        return cls()
 
     def validate(self) -> list[str]:
         """Validate configuration and return list of missing required variables.
@@ -83,3 +90,23 @@ class Config:
             missing.append("LLM_ENDPOINT")
 
         return missing
+
+
+@functools.lru_cache(maxsize=None)
+def _config_for_snapshot(snapshot: Tuple[Optional[str], ...]) -> Config:
+    """Construct a Config for a given environment snapshot."""
+    return Config()
+
+
+def get_config() -> Config:
+    """Get a shared Config instance for the current environment.
+
+    Config snapshots the environment at construction, so the cache is keyed
+    on the variables it reads; a changed environment yields a fresh instance
+    instead of a stale one.
+
+    Returns:
+        Memoized Config instance, so the .env file search runs only once
+        per distinct environment.
+    """
+    return _config_for_snapshot(tuple(os.getenv(var) for var in _ENV_VARS))
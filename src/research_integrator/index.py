@@ -0,0 +1,222 @@
+"""In-memory paper index stored as Struct-of-Arrays NumPy columns.
+
+Document attributes live in parallel arrays (ids, doc_lens, pub_year,
+source) with a CSR posting list per vocabulary term, so the Numba
+scoring kernels in ranking.py stream contiguous int32/float32 buffers.
+Paper models are materialized only for the final top-k rows at the
+response boundary.
+"""
+
+import math
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .api.models import Paper, SourceEnum
+from .ranking import score_bm25, topk
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Fixed source ordering for the int8 source column
+_SOURCES = (SourceEnum.PUBMED, SourceEnum.ARXIV, SourceEnum.OTHER)
+_SOURCE_CODES = {source: np.int8(code) for code, source in enumerate(_SOURCES)}
+
+
+def _tokenize(text: str) -> List[str]:
+    """Split text into lowercase alphanumeric tokens."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+class Index:
+    """Columnar paper index for scan-heavy ranking queries."""
+
+    def __init__(
+        self,
+        ids: np.ndarray,
+        titles: np.ndarray,
+        doc_lens: np.ndarray,
+        pub_year: np.ndarray,
+        source: np.ndarray,
+        vocabulary: Dict[str, int],
+        postings_indptr: np.ndarray,
+        postings_docs: np.ndarray,
+        postings_freqs: np.ndarray,
+        idf: np.ndarray,
+    ):
+        """Initialize the index from prebuilt columns.
+
+        Args:
+            ids: object array of paper identifiers.
+            titles: object array of paper titles.
+            doc_lens: int32 token count per document.
+            pub_year: int16 publication year per document (0 if unknown).
+            source: int8 source code per document (see _SOURCES).
+            vocabulary: Mapping of term to term id.
+            postings_indptr: int32 CSR row pointers, one slice per term.
+            postings_docs: int32 document row index per posting.
+            postings_freqs: int32 term frequency per posting.
+            idf: float32 inverse document frequency per term.
+        """
+        self.ids = ids
+        self.titles = titles
+        self.doc_lens = doc_lens
+        self.pub_year = pub_year
+        self.source = source
+        self.vocabulary = vocabulary
+        self.postings_indptr = postings_indptr
+        self.postings_docs = postings_docs
+        self.postings_freqs = postings_freqs
+        self.idf = idf
+        self.avg_doc_len = np.float32(doc_lens.mean()) if len(doc_lens) else np.float32(1.0)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def build(cls, papers: Iterable[Paper]) -> "Index":
+        """Build an index from Paper models.
+
+        Args:
+            papers: Papers whose title and abstract are indexed.
+
+        Returns:
+            Populated Index instance.
+        """
+        papers = list(papers)
+        num_docs = len(papers)
+
+        ids = np.empty(num_docs, dtype=object)
+        titles = np.empty(num_docs, dtype=object)
+        doc_lens = np.zeros(num_docs, dtype=np.int32)
+        pub_year = np.zeros(num_docs, dtype=np.int16)
+        source = np.zeros(num_docs, dtype=np.int8)
+
+        vocabulary: Dict[str, int] = {}
+        term_postings: List[Dict[int, int]] = []
+
+        for row, paper in enumerate(papers):
+            ids[row] = paper.id
+            titles[row] = paper.title
+            if paper.publication_date:
+                pub_year[row] = paper.publication_date.year
+            source[row] = _SOURCE_CODES.get(paper.source, _SOURCE_CODES[SourceEnum.OTHER])
+
+            tokens = _tokenize(paper.title)
+            if paper.abstract:
+                tokens += _tokenize(paper.abstract)
+            doc_lens[row] = len(tokens)
+
+            for token in tokens:
+                term_id = vocabulary.setdefault(token, len(vocabulary))
+                if term_id == len(term_postings):
+                    term_postings.append({})
+                postings = term_postings[term_id]
+                postings[row] = postings.get(row, 0) + 1
+
+        # Flatten per-term postings into CSR arrays
+        indptr = np.zeros(len(vocabulary) + 1, dtype=np.int32)
+        for term_id, postings in enumerate(term_postings):
+            indptr[term_id + 1] = indptr[term_id] + len(postings)
+
+        total_postings = int(indptr[-1])
+        postings_docs = np.zeros(total_postings, dtype=np.int32)
+        postings_freqs = np.zeros(total_postings, dtype=np.int32)
+        idf = np.zeros(len(vocabulary), dtype=np.float32)
+
+        for term_id, postings in enumerate(term_postings):
+            start = indptr[term_id]
+            for offset, (row, freq) in enumerate(sorted(postings.items())):
+                postings_docs[start + offset] = row
+                postings_freqs[start + offset] = freq
+            doc_freq = len(postings)
+            idf[term_id] = math.log(1.0 + (num_docs - doc_freq + 0.5) / (doc_freq + 0.5))
+
+        return cls(
+            ids=ids,
+            titles=titles,
+            doc_lens=doc_lens,
+            pub_year=pub_year,
+            source=source,
+            vocabulary=vocabulary,
+            postings_indptr=indptr,
+            postings_docs=postings_docs,
+            postings_freqs=postings_freqs,
+            idf=idf,
+        )
+
+    def search(self, query: str, limit: int, offset: int = 0) -> Tuple[List[Paper], int]:
+        """Rank indexed papers against a query.
+
+        Args:
+            query: Free-text search query.
+            limit: Maximum number of papers to return.
+            offset: Number of ranked papers to skip.
+
+        Returns:
+            Tuple of (papers for the requested page, total number of hits).
+        """
+        term_ids = [
+            self.vocabulary[token]
+            for token in _tokenize(query)
+            if token in self.vocabulary
+        ]
+        if not term_ids or not len(self.ids):
+            return [], 0
+
+        # Gather the CSR slices for the query terms into flat posting arrays
+        doc_indices = np.concatenate([
+            self.postings_docs[self.postings_indptr[t]:self.postings_indptr[t + 1]]
+            for t in term_ids
+        ])
+        term_freqs = np.concatenate([
+            self.postings_freqs[self.postings_indptr[t]:self.postings_indptr[t + 1]]
+            for t in term_ids
+        ])
+        posting_idf = np.concatenate([
+            np.full(
+                int(self.postings_indptr[t + 1] - self.postings_indptr[t]),
+                self.idf[t],
+                dtype=np.float32,
+            )
+            for t in term_ids
+        ])
+
+        scores = score_bm25(
+            doc_indices,
+            term_freqs,
+            posting_idf,
+            self.doc_lens,
+            self.avg_doc_len,
+            np.int64(len(self.ids)),
+        )
+        total = int(np.count_nonzero(scores))
+        ranked = topk(scores, np.int64(offset + limit))[offset:]
+
+        # Materialize Paper models only for the final page of rows
+        papers = [
+            Paper(
+                id=self.ids[row],
+                title=self.titles[row],
+                source=_SOURCES[self.source[row]],
+                publication_date=None,
+            )
+            for row in ranked
+            if scores[row] > 0.0
+        ]
+        return papers, total
+
+
+# Index shared by the search endpoint; None until one is loaded.
+_index: Optional[Index] = None
+
+
+def get_index() -> Optional[Index]:
+    """Get the loaded paper index, if any."""
+    return _index
+
+
+def set_index(index: Optional[Index]) -> None:
+    """Install the in-memory paper index used by the search endpoint."""
+    global _index
+    _index = index
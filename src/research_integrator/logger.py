@@ -1,12 +1,20 @@
 """Structured JSON logging configuration."""
 
-import json
+import atexit
+import copy
 import logging
 import logging.handlers
 import os
+import queue
 from pathlib import Path
 from typing import Any, Dict
 
+import orjson
+
+# Active QueueListener per logger name, so handlers can be re-configured
+# and listeners stopped cleanly at interpreter exit.
+_listeners: Dict[str, logging.handlers.QueueListener] = {}
+
 
 class JSONFormatter(logging.Formatter):
     """Custom formatter that outputs log records as JSON."""
@@ -20,6 +28,10 @@ class JSONFormatter(logging.Formatter):
         Returns:
             JSON formatted log string.
         """
+        # Pre-bind record attributes to avoid repeated attribute lookups
+        exc_info = record.exc_info
+        extra_fields = getattr(record, "extra_fields", None)
+
         log_data: Dict[str, Any] = {
             "timestamp": self.formatTime(record, self.datefmt),
             "level": record.levelname,
@@ -31,14 +43,74 @@ class JSONFormatter(logging.Formatter):
         }
 
         # Add exception info if present
-        if record.exc_info:
-            log_data["exception"] = self.formatException(record.exc_info)
+        if exc_info:
+            log_data["exception"] = self.formatException(exc_info)
 
         # Add extra fields if present
-        if hasattr(record, "extra_fields"):
-            log_data.update(record.extra_fields)
+        if extra_fields:
+            log_data.update(extra_fields)
+
+        return orjson.dumps(log_data).decode()
+
+
+class RawQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that enqueues records without pre-formatting them.
+
+    The stock prepare() formats the record on the caller's thread and
+    nulls out exc_info/exc_text before enqueueing. Keeping the record
+    intact moves all formatting (including traceback rendering) onto the
+    listener thread and lets JSONFormatter emit its structured
+    "exception" field. Safe here because the queue never crosses a
+    process boundary, so records need not be pickleable.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Copy so listener-side formatting cannot affect other handlers
+        return copy.copy(record)
+
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler with buffered writes and selective flushing.
+
+    The log file is opened lazily with a 64 KB buffer, and the buffer is
+    only flushed for records at flush_level or above, or after
+    flush_interval records, amortizing write() syscalls across many log
+    lines. An explicit flush() (including on close) always flushes.
+    """
 
-        return json.dumps(log_data, ensure_ascii=False)
+    def __init__(
+        self,
+        *args,
+        flush_level: int = logging.WARNING,
+        flush_interval: int = 128,
+        **kwargs,
+    ):
+        kwargs.setdefault("delay", True)
+        super().__init__(*args, **kwargs)
+        self.flush_level = flush_level
+        self.flush_interval = flush_interval
+        self._unflushed = 0
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=65536, encoding=self.encoding)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write the record, flushing only when a flush is due."""
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            self._unflushed += 1
+            if record.levelno >= self.flush_level or self._unflushed >= self.flush_interval:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        self._unflushed = 0
+        super().flush()
 
 
 def setup_logger(
@@ -87,18 +159,20 @@ def setup_logger(
             datefmt="%Y-%m-%d %H:%M:%S"
         )
 
+    handlers = []
+
     # Create console handler
     if console_output:
         console_handler = logging.StreamHandler()
         console_handler.setLevel(numeric_level)
         console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
 
     # Create rotating file handler
     log_path = Path(log_file)
     log_path.parent.mkdir(parents=True, exist_ok=True)
 
-    file_handler = logging.handlers.RotatingFileHandler(
+    file_handler = BufferedRotatingFileHandler(
         log_file,
         maxBytes=max_bytes,
         backupCount=backup_count,
@@ -106,7 +180,21 @@ def setup_logger(
     )
     file_handler.setLevel(numeric_level)
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    handlers.append(file_handler)
+
+    # Route records through a queue so formatting and I/O happen on a
+    # background thread instead of blocking the caller (e.g. the event loop).
+    shutdown_logger(name)
+    log_queue = queue.SimpleQueue()
+    queue_handler = RawQueueHandler(log_queue)
+    queue_handler.setLevel(numeric_level)
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    listener.start()
+    queue_handler.listener = listener
+    _listeners[name] = listener
+    logger.addHandler(queue_handler)
 
     # Prevent propagation to root logger
     logger.propagate = False
@@ -114,6 +202,32 @@ def setup_logger(
     return logger
 
 
+def shutdown_logger(name: str = "research_integrator") -> None:
+    """Stop the queue listener for a logger, flushing any pending records.
+
+    Args:
+        name: Logger name whose listener should be stopped.
+    """
+    listener = _listeners.pop(name, None)
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            try:
+                handler.flush()
+            except ValueError:
+                # Handler already closed (e.g. by logging.shutdown at exit)
+                pass
+
+
+def _shutdown_all_listeners() -> None:
+    """Stop all active queue listeners at interpreter exit."""
+    for name in list(_listeners):
+        shutdown_logger(name)
+
+
+atexit.register(_shutdown_all_listeners)
+
+
 def get_logger(name: str = "research_integrator") -> logging.Logger:
     """Get logger instance.
 
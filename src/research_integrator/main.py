@@ -1,6 +1,6 @@
 """Main application module demonstrating configuration and logging setup."""
 
-from .config import Config
+from .config import Config, get_config
 from .logger import setup_logger, get_logger
 
 
@@ -13,7 +13,7 @@ class ResearchIntegrator:
         Args:
             config: Configuration instance. If None, creates a new one.
         """
-        self.config = config or Config()
+        self.config = config or get_config()
 
         # Validate configuration
         missing_vars = self.config.validate()
@@ -0,0 +1,61 @@
+"""JIT-compiled scoring kernels for ranking search results.
+
+These kernels operate on the contiguous NumPy columns of the in-memory
+paper index and are lowered to machine code by Numba, so scoring a query
+is a single C-speed pass over the postings instead of a Python loop.
+"""
+
+import numba
+import numpy as np
+
+# Standard BM25 constants
+K1 = np.float32(1.5)
+B = np.float32(0.75)
+
+
+@numba.njit(cache=True, fastmath=True)
+def score_bm25(
+    doc_indices: np.ndarray,
+    term_freqs: np.ndarray,
+    idf: np.ndarray,
+    doc_lens: np.ndarray,
+    avg_doc_len: np.float32,
+    num_docs: np.int64,
+) -> np.ndarray:
+    """Accumulate BM25 scores for the postings of a query's terms.
+
+    Args:
+        doc_indices: int32 row index into the document columns, one per posting.
+        term_freqs: int32 term frequency, one per posting.
+        idf: float32 inverse document frequency of the posting's term.
+        doc_lens: int32 token length of every document in the index.
+        avg_doc_len: Average document length over the index.
+        num_docs: Number of documents in the index.
+
+    Returns:
+        float32 array of BM25 scores, one per document.
+    """
+    scores = np.zeros(num_docs, dtype=np.float32)
+    for i in range(doc_indices.shape[0]):
+        doc = doc_indices[i]
+        tf = np.float32(term_freqs[i])
+        norm = K1 * (np.float32(1.0) - B + B * np.float32(doc_lens[doc]) / avg_doc_len)
+        scores[doc] += idf[i] * tf * (K1 + np.float32(1.0)) / (tf + norm)
+    return scores
+
+
+@numba.njit(cache=True)
+def topk(scores: np.ndarray, k: np.int64) -> np.ndarray:
+    """Get the indices of the k highest scores, best first.
+
+    Args:
+        scores: float32 score per document.
+        k: Number of results to select.
+
+    Returns:
+        int64 array of at most k document indices sorted by descending score.
+    """
+    order = np.argsort(-scores)
+    if k < order.shape[0]:
+        order = order[:k]
+    return order.astype(np.int64)
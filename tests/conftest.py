@@ -0,0 +1,30 @@
+"""Shared pytest fixtures for the test suite."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolate_env(monkeypatch):
+    """Run each test against a clean environment.
+
+    Deletes every variable Config reads so tests only see the values
+    they set themselves via monkeypatch.setenv.
+    """
+    for var in (
+        "PUBMED_API_KEY", "ARXIV_USER_AGENT", "LLM_API_KEY",
+        "LLM_ENDPOINT", "REDIS_URL", "LOG_LEVEL", "LOG_FILE",
+    ):
+        monkeypatch.delenv(var, raising=False)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _prewarm_openapi_schema():
+    """Build the OpenAPI schema once per session.
+
+    FastAPI generates the schema lazily on the first /api/openapi.json
+    request, walking every route signature and Pydantic model. Assigning
+    app.openapi_schema up front makes later hits return the cached dict.
+    """
+    from research_integrator.api.app import app
+
+    app.openapi_schema = app.openapi()
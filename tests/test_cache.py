@@ -0,0 +1,113 @@
+"""Tests for the Redis-backed response cache."""
+
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from research_integrator.cache import ResponseCache, get_response_cache
+
+
+class _FakePipeline:
+    """Buffers commands like the redis pipeline, applying them on execute."""
+
+    def __init__(self, redis):
+        self._redis = redis
+        self._commands = []
+
+    def hset(self, key, mapping):
+        self._commands.append(("hset", key, mapping))
+        return self
+
+    def expire(self, key, ttl):
+        self._commands.append(("expire", key, ttl))
+        return self
+
+    async def execute(self):
+        for command, key, arg in self._commands:
+            if command == "hset":
+                self._redis.store[key] = {
+                    field.encode(): value if isinstance(value, bytes) else value.encode()
+                    for field, value in arg.items()
+                }
+            else:
+                self._redis.ttls[key] = arg
+
+
+class _FakeRedis:
+    """Minimal in-memory stand-in for the async redis client."""
+
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+
+    async def hgetall(self, key):
+        return self.store.get(key, {})
+
+    def pipeline(self):
+        return _FakePipeline(self)
+
+
+class _DownPipeline(_FakePipeline):
+    """Pipeline whose backend is unreachable."""
+
+    async def execute(self):
+        raise RedisConnectionError("connection refused")
+
+
+class _DownRedis:
+    """Stand-in for a redis client whose backend is unreachable."""
+
+    async def hgetall(self, key):
+        raise RedisConnectionError("connection refused")
+
+    def pipeline(self):
+        return _DownPipeline(self)
+
+
+class TestResponseCache:
+    """Test cases for ResponseCache."""
+
+    async def test_disabled_without_redis_url(self):
+        """Test that the cache is inert when no URL is configured."""
+        cache = ResponseCache(None)
+
+        assert not cache.enabled
+        assert await cache.get("search:abc") is None
+        assert await cache.set("search:abc", b"{}", "etag", "application/json") is None
+
+    async def test_set_then_get_roundtrip(self):
+        """Test storing and retrieving a serialized response."""
+        cache = ResponseCache(None, ttl=30)
+        cache._redis = _FakeRedis()
+
+        await cache.set("search:abc", b'{"papers": []}', "etag123", "application/json")
+        entry = await cache.get("search:abc")
+
+        assert entry == {
+            "body": b'{"papers": []}',
+            "etag": "etag123",
+            "ct": "application/json",
+        }
+        assert cache._redis.ttls["search:abc"] == 30
+
+    async def test_get_miss(self):
+        """Test that an unknown key is a miss."""
+        cache = ResponseCache(None)
+        cache._redis = _FakeRedis()
+
+        assert await cache.get("search:missing") is None
+
+    async def test_fails_open_when_unreachable(self):
+        """Test that backend errors degrade to misses instead of raising."""
+        cache = ResponseCache(None)
+        cache._redis = _DownRedis()
+
+        assert await cache.get("search:abc") is None
+        assert await cache.set("search:abc", b"{}", "etag", "application/json") is None
+
+    def test_get_response_cache_singleton(self, monkeypatch):
+        """Test the lazily-built shared cache instance."""
+        monkeypatch.setattr("research_integrator.cache._cache", None)
+
+        cache = get_response_cache()
+
+        assert not cache.enabled  # REDIS_URL is unset in tests
+        assert get_response_cache() is cache
@@ -0,0 +1,131 @@
+"""Tests for the in-memory paper index and ranking kernels."""
+
+from datetime import date
+
+import numpy as np
+import pytest
+
+from research_integrator.api.models import Paper, SourceEnum
+from research_integrator.index import Index, get_index, set_index
+from research_integrator.ranking import topk
+
+
+def _paper(paper_id, title, abstract=None, source=SourceEnum.PUBMED, publication_date=None):
+    """Build a Paper with only the fields the index reads."""
+    return Paper(
+        id=paper_id,
+        title=title,
+        abstract=abstract,
+        source=source,
+        publication_date=publication_date,
+    )
+
+
+_CORPUS = [
+    _paper(
+        "pubmed:1",
+        "Machine learning in healthcare",
+        abstract="Machine learning methods for clinical data",
+        publication_date=date(2021, 5, 1),
+    ),
+    _paper("arxiv:2301.12345", "Deep learning for protein folding", source=SourceEnum.ARXIV),
+    _paper("pubmed:2", "Statistical methods for clinical trials"),
+    _paper("other:3", "Graph neural networks", source=SourceEnum.OTHER),
+]
+
+
+@pytest.fixture(scope="module")
+def index():
+    """Index over the small fixed corpus, built once per module."""
+    return Index.build(_CORPUS)
+
+
+class TestIndexBuild:
+    """Test cases for Index.build."""
+
+    def test_build_columns(self, index):
+        """Test that document columns are populated from the papers."""
+        assert len(index) == 4
+        assert index.ids[0] == "pubmed:1"
+        assert index.titles[3] == "Graph neural networks"
+        # Title plus abstract tokens for the first paper
+        assert index.doc_lens[0] == 10
+        assert index.pub_year[0] == 2021
+        assert index.pub_year[1] == 0  # No publication date
+
+    def test_build_vocabulary_and_postings(self, index):
+        """Test vocabulary and CSR posting-list consistency."""
+        assert "machine" in index.vocabulary
+        assert "MACHINE" not in index.vocabulary  # Tokens are lowercased
+
+        # One indptr slice per term, covering all postings exactly
+        assert len(index.postings_indptr) == len(index.vocabulary) + 1
+        assert index.postings_indptr[-1] == len(index.postings_docs)
+
+        # "learning" appears in two documents
+        term_id = index.vocabulary["learning"]
+        start, end = index.postings_indptr[term_id], index.postings_indptr[term_id + 1]
+        assert end - start == 2
+
+    def test_build_empty(self):
+        """Test building and searching an empty index."""
+        index = Index.build([])
+
+        assert len(index) == 0
+        assert index.search("machine", limit=10) == ([], 0)
+
+
+class TestIndexSearch:
+    """Test cases for Index.search."""
+
+    def test_search_ranks_by_relevance(self, index):
+        """Test that the best-matching paper is ranked first."""
+        papers, total = index.search("machine learning", limit=10)
+
+        assert total == 2  # Both learning papers match
+        assert papers[0].id == "pubmed:1"  # Matches both query terms
+        assert papers[0].title == "Machine learning in healthcare"
+        assert papers[0].source == SourceEnum.PUBMED
+        assert papers[1].source == SourceEnum.ARXIV
+
+    def test_search_paging(self, index):
+        """Test that limit and offset slice the ranked results."""
+        full, total = index.search("clinical", limit=10)
+        assert total == 2
+        assert len(full) == 2
+
+        page, page_total = index.search("clinical", limit=1, offset=1)
+        assert page_total == total
+        assert [paper.id for paper in page] == [full[1].id]
+
+    def test_search_no_match(self, index):
+        """Test queries that match nothing."""
+        assert index.search("quantum", limit=10) == ([], 0)
+        assert index.search("", limit=10) == ([], 0)
+
+    def test_search_ignores_unknown_tokens(self, index):
+        """Test that out-of-vocabulary query tokens are skipped."""
+        papers, total = index.search("healthcare qzxv", limit=10)
+
+        assert total == 1
+        assert papers[0].id == "pubmed:1"
+
+    def test_shared_index_registry(self, index):
+        """Test the module-level get_index/set_index pair."""
+        assert get_index() is None
+        set_index(index)
+        try:
+            assert get_index() is index
+        finally:
+            set_index(None)
+
+
+class TestTopk:
+    """Test cases for the topk ranking kernel."""
+
+    def test_topk_orders_descending(self):
+        """Test that topk returns the k highest-scored rows in order."""
+        scores = np.array([0.1, 3.0, 2.0, 0.0], dtype=np.float32)
+
+        assert list(topk(scores, np.int64(3))) == [1, 2, 0]
+        assert list(topk(scores, np.int64(1))) == [1]
@@ -1,157 +1,200 @@
 """Tests for logging functionality."""
 
+import io
 import json
 import logging
-import tempfile
-import unittest
-from pathlib import Path
+import logging.handlers
+import time
 
-from research_integrator.logger import JSONFormatter, setup_logger, get_logger
+import pytest
 
+from research_integrator.logger import JSONFormatter, setup_logger, get_logger, shutdown_logger
+
+# Frozen point in time for exact timestamp assertions
+_FROZEN_TIME = 1735689600.0  # 2025-01-01 00:00:00 UTC
+_FROZEN_STAMP = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(_FROZEN_TIME))
+
+
+@pytest.fixture
+def frozen_time(monkeypatch):
+    """Pin the clock logging reads so record timestamps are constant."""
+    monkeypatch.setattr("logging.time.time", lambda: _FROZEN_TIME)
 
-class TestJSONFormatter(unittest.TestCase):
-    """Test cases for JSONFormatter class."""
 
-    def setUp(self):
-        """Set up test environment."""
-        self.formatter = JSONFormatter()
+def _make_record(**overrides):
+    """Build a LogRecord with test defaults for direct formatter calls."""
+    defaults = dict(
+        name="test_logger",
+        level=logging.INFO,
+        pathname="/test/path.py",
+        lineno=42,
+        msg="Test message",
+        args=(),
+        exc_info=None,
+        func="test_function",
+    )
+    defaults.update(overrides)
+    return logging.LogRecord(**defaults)
+
+
+class TestJSONFormatter:
+    """Test cases for JSONFormatter class."""
 
-    def test_json_format(self):
+    def test_json_format(self, frozen_time):
         """Test JSON formatting of log records."""
-        record = logging.LogRecord(
-            name="test_logger",
-            level=logging.INFO,
-            pathname="/test/path.py",
-            lineno=42,
-            msg="Test message",
-            args=(),
-            exc_info=None,
-            func="test_function"
-        )
-
-        formatted = self.formatter.format(record)
+        formatted = JSONFormatter(datefmt="%Y-%m-%d %H:%M:%S").format(_make_record())
         log_data = json.loads(formatted)
 
-        self.assertEqual(log_data["level"], "INFO")
-        self.assertEqual(log_data["logger"], "test_logger")
-        self.assertEqual(log_data["message"], "Test message")
-        self.assertEqual(log_data["module"], "path")
-        self.assertEqual(log_data["function"], "test_function")
-        self.assertEqual(log_data["line"], 42)
-        self.assertIn("timestamp", log_data)
+        assert log_data["level"] == "INFO"
+        assert log_data["logger"] == "test_logger"
+        assert log_data["message"] == "Test message"
+        assert log_data["module"] == "path"
+        assert log_data["function"] == "test_function"
+        assert log_data["line"] == 42
+        assert log_data["timestamp"] == _FROZEN_STAMP
 
     def test_json_format_with_extra_fields(self):
         """Test JSON formatting with extra fields."""
-        record = logging.LogRecord(
-            name="test_logger",
-            level=logging.INFO,
-            pathname="/test/path.py",
-            lineno=42,
-            msg="Test message",
-            args=(),
-            exc_info=None,
-            func="test_function"
-        )
+        record = _make_record()
         record.extra_fields = {"user_id": 123, "action": "test"}
 
-        formatted = self.formatter.format(record)
+        formatted = JSONFormatter().format(record)
         log_data = json.loads(formatted)
 
-        self.assertEqual(log_data["user_id"], 123)
-        self.assertEqual(log_data["action"], "test")
+        assert log_data["user_id"] == 123
+        assert log_data["action"] == "test"
 
 
-class TestLogger(unittest.TestCase):
+class TestLogger:
     """Test cases for logger setup and functionality."""
 
-    def setUp(self):
-        """Set up test environment."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.log_file = str(Path(self.temp_dir) / "test.log")
+    @pytest.fixture
+    def log_file(self, tmp_path):
+        """Per-test log file path."""
+        return str(tmp_path / "test.log")
 
-    def tearDown(self):
-        """Clean up test environment."""
-        # Clear all handlers from loggers
-        for logger_name in logging.Logger.manager.loggerDict:
-            logger = logging.getLogger(logger_name)
+    @pytest.fixture
+    def make_memory_logger(self):
+        """Create loggers that write JSON to an in-memory StringIO sink.
+
+        Keeps disk out of tests that only assert on formatted output;
+        test_logger_file_creation stays on the real rotating file
+        handler to cover the on-disk path.
+        """
+        created = []
+
+        def _make(name):
+            logger = logging.getLogger(name)
             logger.handlers.clear()
+            logger.setLevel(logging.INFO)
+            handler = logging.StreamHandler(io.StringIO())
+            handler.setFormatter(JSONFormatter(datefmt="%Y-%m-%d %H:%M:%S"))
+            logger.addHandler(handler)
+            logger.propagate = False
+            created.append(name)
+            return logger, handler.stream
+
+        yield _make
+
+        for name in created:
+            logging.getLogger(name).handlers.clear()
+
+    @pytest.fixture
+    def make_logger(self, log_file):
+        """Create loggers via setup_logger, cleaning up only those created.
+
+        Tracking the names handed out here avoids sweeping the global
+        loggerDict after every test.
+        """
+        created = []
 
-    def test_setup_logger_basic(self):
+        def _make(name, **kwargs):
+            kwargs.setdefault("log_file", log_file)
+            logger = setup_logger(name=name, **kwargs)
+            created.append(name)
+            return logger
+
+        yield _make
+
+        for name in created:
+            shutdown_logger(name)
+            logging.getLogger(name).handlers.clear()
+
+    def test_setup_logger_basic(self, make_logger):
         """Test basic logger setup."""
-        logger = setup_logger(
-            name="test_logger",
-            level="INFO",
-            log_file=self.log_file,
-            console_output=False
-        )
-
-        self.assertEqual(logger.name, "test_logger")
-        self.assertEqual(logger.level, logging.INFO)
-        self.assertEqual(len(logger.handlers), 1)  # Only file handler
-        self.assertIsInstance(logger.handlers[0], logging.handlers.RotatingFileHandler)
-
-    def test_setup_logger_with_console(self):
+        logger = make_logger("test_logger", level="INFO", console_output=False)
+
+        assert logger.name == "test_logger"
+        assert logger.level == logging.INFO
+        assert len(logger.handlers) == 1  # Queue handler only
+        assert isinstance(logger.handlers[0], logging.handlers.QueueHandler)
+
+        # The listener behind the queue drives only the file handler
+        listener_handlers = logger.handlers[0].listener.handlers
+        assert len(listener_handlers) == 1
+        assert isinstance(listener_handlers[0], logging.handlers.RotatingFileHandler)
+
+    def test_setup_logger_with_console(self, make_logger):
         """Test logger setup with console output."""
-        logger = setup_logger(
-            name="test_logger_console",
-            level="DEBUG",
-            log_file=self.log_file,
-            console_output=True
-        )
+        logger = make_logger("test_logger_console", level="DEBUG", console_output=True)
 
-        self.assertEqual(logger.level, logging.DEBUG)
-        self.assertEqual(len(logger.handlers), 2)  # Console and file handlers
+        assert logger.level == logging.DEBUG
+        assert len(logger.handlers) == 1  # Queue handler only
 
-        handler_types = [type(h).__name__ for h in logger.handlers]
-        self.assertIn("StreamHandler", handler_types)
-        self.assertIn("RotatingFileHandler", handler_types)
+        # Console and file handlers both sit behind the queue listener
+        handler_types = [type(h).__name__ for h in logger.handlers[0].listener.handlers]
+        assert "StreamHandler" in handler_types
+        assert "BufferedRotatingFileHandler" in handler_types
 
-    def test_logger_file_creation(self):
+    def test_logger_file_creation(self, make_logger, log_file, tmp_path, frozen_time):
         """Test that log file is created."""
-        logger = setup_logger(
-            name="test_file_creation",
-            log_file=self.log_file,
-            console_output=False
-        )
+        logger = make_logger("test_file_creation", console_output=False)
 
         logger.info("Test message")
+        shutdown_logger("test_file_creation")  # Flush queued records to disk
 
-        self.assertTrue(Path(self.log_file).exists())
-
-        with open(self.log_file, 'r') as f:
-            content = f.read()
-            self.assertIn("Test message", content)
+        assert (tmp_path / "test.log").exists()
+        content = (tmp_path / "test.log").read_text()
+        assert "Test message" in content
+        assert _FROZEN_STAMP in content
 
-    def test_json_logging(self):
+    def test_json_logging(self, make_memory_logger, frozen_time):
         """Test JSON formatted logging."""
-        logger = setup_logger(
-            name="test_json",
-            log_file=self.log_file,
-            console_output=False,
-            json_format=True
-        )
+        logger, stream = make_memory_logger("test_json")
 
         logger.info("Test JSON message")
 
-        with open(self.log_file, 'r') as f:
-            line = f.readline().strip()
-            log_data = json.loads(line)
+        line = stream.getvalue().splitlines()[0]
+        log_data = json.loads(line)
 
-            self.assertEqual(log_data["level"], "INFO")
-            self.assertEqual(log_data["message"], "Test JSON message")
-            self.assertIn("timestamp", log_data)
+        assert log_data["level"] == "INFO"
+        assert log_data["message"] == "Test JSON message"
+        assert log_data["timestamp"] == _FROZEN_STAMP
 
-    def test_get_logger(self):
+    def test_json_logging_with_exception(self, make_logger, tmp_path):
+        """Test that exc_info survives the queue into the JSON output."""
+        logger = make_logger("test_json_exc", console_output=False, json_format=True)
+
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.error("Something failed", exc_info=True)
+        shutdown_logger("test_json_exc")  # Flush queued records to disk
+
+        line = (tmp_path / "test.log").read_text().splitlines()[0]
+        log_data = json.loads(line)
+
+        # The traceback must land in the structured field, not the message
+        assert log_data["message"] == "Something failed"
+        assert "ValueError: boom" in log_data["exception"]
+
+    def test_get_logger(self, make_logger):
         """Test get_logger function."""
         # First setup a logger
-        setup_logger(name="test_get", log_file=self.log_file)
+        make_logger("test_get")
 
         # Then get it
         logger = get_logger("test_get")
 
-        self.assertEqual(logger.name, "test_get")
-        self.assertGreater(len(logger.handlers), 0)
-
-
-if __name__ == "__main__":
-    unittest.main()
+        assert logger.name == "test_get"
+        assert len(logger.handlers) > 0
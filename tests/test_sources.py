@@ -0,0 +1,35 @@
+"""Tests for the batched source backends."""
+
+from research_integrator.sources import bucket_paper_ids, fetch_arxiv_batch, fetch_pubmed_batch
+
+
+class TestBucketPaperIds:
+    """Test cases for bucket_paper_ids."""
+
+    def test_buckets_by_prefix(self):
+        """Test splitting mixed ids into per-backend buckets."""
+        pubmed, arxiv, other = bucket_paper_ids([
+            "pmid:12345678",
+            "pubmed:87654321",
+            "arxiv:2301.12345",
+            "doi:10.1000/xyz",  # unknown prefix
+            "12345678",  # bare id, no prefix
+            "pmid:",  # prefix without an id
+        ])
+
+        assert pubmed == ["12345678", "87654321"]
+        assert arxiv == ["2301.12345"]
+        assert other == ["doi:10.1000/xyz", "12345678", "pmid:"]
+
+    def test_empty_input(self):
+        """Test bucketing an empty id list."""
+        assert bucket_paper_ids([]) == ([], [], [])
+
+
+class TestFetchBatches:
+    """Test cases for the batched fetch helpers."""
+
+    async def test_empty_buckets_skip_requests(self):
+        """Test that empty buckets return without touching the client."""
+        assert await fetch_pubmed_batch(None, []) == []
+        assert await fetch_arxiv_batch(None, []) == []